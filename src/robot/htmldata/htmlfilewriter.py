@@ -15,7 +15,8 @@
 
 import re
 from abc import ABC, abstractmethod
-from io import TextIOBase
+from functools import lru_cache
+from io import StringIO, TextIOBase
 from pathlib import Path
 
 from robot.utils import HtmlWriter
@@ -33,20 +34,42 @@ class HtmlFileWriter:
     def write(self, template: 'Path|str'):
         if not isinstance(template, Path):
             template = Path(template)
-        writers = self._get_writers(template.parent)
-        for line in HtmlTemplate(template):
-            for writer in writers:
-                if writer.handles(line):
-                    writer.write(line)
-                    break
-
-    def _get_writers(self, base_dir: Path):
-        writer = HtmlWriter(self.output)
-        return (self.model_writer,
-                JsFileWriter(writer, base_dir),
-                CssFileWriter(writer, base_dir),
-                GeneratorWriter(writer),
-                LineWriter(self.output))
+        for content, model_line in compile_template(template):
+            self.output.write(content)
+            if model_line:
+                self.model_writer.write(model_line)
+
+
+@lru_cache(maxsize=None)
+def compile_template(template: Path) -> 'tuple[tuple[str, str|None], ...]':
+    """Renders everything else in the template except the model.
+
+    Returns ``(content, model_line)`` tuples where ``content`` is ready to be
+    written as-is and ``model_line`` is the line to pass to the model writer
+    after it or ``None`` at the end. Results are cached because the content
+    is the same in all outputs created using the same template.
+    """
+    output = StringIO()
+    writer = HtmlWriter(output)
+    base_dir = template.parent
+    writers = (JsFileWriter(writer, base_dir),
+               CssFileWriter(writer, base_dir),
+               GeneratorWriter(writer),
+               LineWriter(output))
+    parts = []
+    start = 0
+    for line in HtmlTemplate(template):
+        if line.startswith(ModelWriter.handles_line):
+            content = output.getvalue()
+            parts.append((content[start:], line))
+            start = len(content)
+            continue
+        for writer in writers:
+            if writer.handles(line):
+                writer.write(line)
+                break
+    parts.append((output.getvalue()[start:], None))
+    return tuple(parts)
 
 
 class Writer(ABC):
@@ -33,15 +33,16 @@ This module also exposes the following public API:
 Libdoc itself is implemented in the :mod:`~robot.libdocpkg` package.
 """
 
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 if __name__ == '__main__' and 'robot' not in sys.modules:
     import pythonpathsetter
 
-from robot.utils import Application, seq2str
+from robot.utils import Application, is_truthy, seq2str
 from robot.errors import DataError
-from robot.libdocpkg import LibraryDocumentation, ConsoleViewer
 
 
 USAGE = """Libdoc -- Robot Framework library documentation generator
@@ -152,6 +153,16 @@ Examples:
   libdoc SeleniumLibrary show intro
   libdoc SeleniumLibrary version
 
+Caching
+=======
+
+If Libdoc is executed multiple times in the same process, for example, using
+the `libdoc_cli` or `libdoc` functions, generated documentation can be cached
+by setting the `ROBOT_LIBDOC_CACHE` environment variable to a true value (i.e.
+not `false`, `no`, `off`, `0`, `none` or empty). Libraries and resources given
+as paths to files are parsed again if the files have been modified, but
+libraries given by name are not re-imported.
+
 Alternative execution
 =====================
 
@@ -171,6 +182,7 @@ class LibDoc(Application):
         Application.__init__(self, USAGE, arg_limits=(2,), auto_version=False)
 
     def validate(self, options, arguments):
+        from robot.libdocpkg import ConsoleViewer
         if ConsoleViewer.handles(arguments[1]):
             ConsoleViewer.validate_command(arguments[1], arguments[2:])
             return options, arguments
@@ -180,29 +192,40 @@ class LibDoc(Application):
 
     def main(self, args, name='', version='', format=None, docformat=None,
              specdocformat=None, theme=None, pythonpath=None, quiet=False):
+        from robot.libdocpkg import ConsoleViewer
         if pythonpath:
-            sys.path = pythonpath + sys.path
+            # Avoid adding same paths multiple times when called repeatedly.
+            sys.path = pythonpath + [p for p in sys.path if p not in pythonpath]
         lib_or_res, output = args[:2]
         docformat = self._get_docformat(docformat)
-        libdoc = LibraryDocumentation(lib_or_res, name, version, docformat)
         if ConsoleViewer.handles(output):
+            libdoc = self._get_libdoc(lib_or_res, name, version, docformat)
             ConsoleViewer(libdoc).view(output, *args[2:])
             return
         format, specdocformat \
             = self._get_format_and_specdocformat(format, specdocformat, output)
-        if (format == 'HTML'
-                or specdocformat == 'HTML'
-                or format in ('JSON', 'LIBSPEC') and specdocformat != 'RAW'):
-            libdoc.convert_docs_to_html()
+        to_html = (format == 'HTML'
+                   or specdocformat == 'HTML'
+                   or format in ('JSON', 'LIBSPEC') and specdocformat != 'RAW')
+        libdoc = self._get_libdoc(lib_or_res, name, version, docformat, to_html)
         libdoc.save(output, format, self._validate_theme(theme, format))
         if not quiet:
             self.console(Path(output).absolute())
 
+    def _get_libdoc(self, lib_or_res, name, version, docformat, to_html=False):
+        if not is_truthy(os.getenv('ROBOT_LIBDOC_CACHE')):
+            return _build_libdoc(lib_or_res, name, version, docformat, to_html)
+        lib_or_res = os.fspath(lib_or_res)
+        path = os.path.abspath(lib_or_res.split('::')[0])
+        mtime = os.path.getmtime(path) if os.path.isfile(path) else None
+        return _build_cached_libdoc(lib_or_res, os.getcwd(), tuple(sys.path),
+                                    mtime, name, version, docformat, to_html)
+
     def _get_docformat(self, docformat):
         return self._validate('Doc format', docformat, 'ROBOT', 'TEXT', 'HTML', 'REST')
 
     def _get_format_and_specdocformat(self, format, specdocformat, output):
-        extension = Path(output).suffix[1:]
+        extension = os.path.splitext(output)[1][1:]
         format = self._validate('Format', format or extension,
                                 'HTML', 'XML', 'JSON', 'LIBSPEC')
         specdocformat = self._validate('Spec doc format', specdocformat, 'RAW', 'HTML')
@@ -229,6 +252,27 @@ class LibDoc(Application):
         return theme
 
 
+@lru_cache(maxsize=None)
+def _get_application():
+    # The application has no execution specific state so it can be reused.
+    return LibDoc()
+
+
+def _build_libdoc(lib_or_res, name, version, docformat, to_html):
+    from robot.libdocpkg import LibraryDocumentation
+    libdoc = LibraryDocumentation(lib_or_res, name, version, docformat)
+    if to_html:
+        libdoc.convert_docs_to_html()
+    return libdoc
+
+
+@lru_cache(maxsize=128)
+def _build_cached_libdoc(lib_or_res, cwd, pythonpath, mtime, name, version,
+                         docformat, to_html):
+    # `cwd`, `pythonpath` and `mtime` are only part of the cache key.
+    return _build_libdoc(lib_or_res, name, version, docformat, to_html)
+
+
 def libdoc_cli(arguments=None, exit=True):
     """Executes Libdoc similarly as from the command line.
 
@@ -246,7 +290,7 @@ def libdoc_cli(arguments=None, exit=True):
     """
     if arguments is None:
         arguments = sys.argv[1:]
-    LibDoc().execute_cli(arguments, exit=exit)
+    _get_application().execute_cli(arguments, exit=exit)
 
 
 def libdoc(library_or_resource, outfile, name='', version='', format=None,
@@ -278,17 +322,34 @@ def libdoc(library_or_resource, outfile, name='', version='', format=None,
     Run ``libdoc --help`` or consult the Libdoc section in the Robot Framework
     User Guide for more details.
 
+    If the ``ROBOT_LIBDOC_CACHE`` environment variable is set to a true value
+    (i.e. not ``false``, ``no``, ``off``, ``0``, ``none`` or empty), generated
+    documentation is cached and reused if this function is called again with
+    the same arguments in the same process. If the library or resource is
+    given as a path to a file, the file is parsed again if it has been
+    modified. Libraries given by name are not re-imported even if their
+    source has changed.
+
     Example::
 
         from robot.libdoc import libdoc
 
         libdoc('MyLibrary.py', 'MyLibrary.html', version='1.0')
     """
-    return LibDoc().execute(
+    return _get_application().execute(
         library_or_resource, outfile, name=name, version=version, format=format,
         docformat=docformat, specdocformat=specdocformat, quiet=quiet
     )
 
 
+def __getattr__(name):
+    # `robot.libdocpkg` is imported only when needed to make, for example,
+    # `libdoc --help` faster. `LibraryDocumentation` is part of the public API.
+    if name in ('LibraryDocumentation', 'ConsoleViewer'):
+        import robot.libdocpkg
+        return getattr(robot.libdocpkg, name)
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+
+
 if __name__ == '__main__':
     libdoc_cli(sys.argv[1:])
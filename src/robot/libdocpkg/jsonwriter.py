@@ -13,11 +13,8 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
-from robot.utils import file_writer
-
 
 class LibdocJsonWriter:
 
-    def write(self, libdoc, outfile):
-        with file_writer(outfile) as writer:
-            writer.write(libdoc.to_json(indent=2))
+    def write(self, libdoc, output):
+        output.write(libdoc.to_json(indent=2))
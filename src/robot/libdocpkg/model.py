@@ -90,6 +90,12 @@ class LibraryDoc:
         return Tags(chain.from_iterable(kw.tags for kw in self.keywords))
 
     def save(self, output=None, format='HTML', theme=None):
+        """Save documentation to the given output.
+
+        ``output`` can be a path or an already opened, text mode file object.
+        Opened files are not closed.
+        """
+        format = format.upper() if format else 'HTML'
         with LibdocOutput(output, format) as outfile:
             LibdocWriter(format, theme).write(self, outfile)
 
@@ -22,26 +22,26 @@ from robot.utils import file_writer
 
 class LibdocOutput:
 
-    def __init__(self, output_path, format):
-        self._output_path = output_path
-        self._format = format.upper()
+    def __init__(self, output, format):
+        self._output = output
+        self._format = format
         self._output_file = None
 
     def __enter__(self):
-        if self._format == 'HTML':
-            self._output_file = file_writer(self._output_path,
-                                            usage='Libdoc output')
-            return self._output_file
-        return self._output_path
+        if hasattr(self._output, 'write'):
+            return self._output
+        usage = 'Libdoc output' if self._format == 'HTML' else 'Libdoc spec'
+        self._output_file = file_writer(self._output, usage=usage)
+        return self._output_file
 
     def __exit__(self, *exc_info):
         if self._output_file:
             self._output_file.close()
-        if any(exc_info):
-            try:
-                os.remove(self._output_path)
-            except OSError:
-                pass
+            if any(exc_info) and self._output:
+                try:
+                    os.remove(self._output)
+                except OSError:
+                    pass
 
 
 def get_generation_time():
@@ -21,8 +21,8 @@ from .output import get_generation_time
 
 class LibdocXmlWriter:
 
-    def write(self, libdoc, outfile):
-        writer = XmlWriter(outfile, usage='Libdoc spec')
+    def write(self, libdoc, output):
+        writer = XmlWriter(output, usage='Libdoc spec')
         self._write_start(libdoc, writer)
         self._write_keywords('inits', 'init', libdoc.inits, libdoc.source, writer)
         self._write_keywords('keywords', 'kw', libdoc.keywords, libdoc.source, writer)
@@ -169,4 +169,3 @@ class LibdocXmlWriter:
 
     def _write_end(self, writer):
         writer.end('keywordspec')
-        writer.close()
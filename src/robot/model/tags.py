@@ -35,6 +35,8 @@ class Tags(Sequence[str]):
     def _init_tags(self, tags) -> 'tuple[tuple[str, ...], tuple[str, ...]]':
         if not tags:
             return (), ()
+        if isinstance(tags, Tags):
+            return tags._tags, tags._reserved
         if is_string(tags):
             tags = (tags,)
         return self._normalize(tags)
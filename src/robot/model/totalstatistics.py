@@ -78,7 +78,9 @@ class TotalStatisticsBuilder(SuiteVisitor):
     def __init__(self, suite=None, rpa=False):
         self.stats = TotalStatistics(rpa)
         if suite:
-            suite.visit(self)
+            # Iterating over tests directly is a lot faster than visiting.
+            for test in suite.all_tests:
+                self.add_test(test)
 
     def add_test(self, test):
         self.stats.add_test(test)
@@ -111,6 +111,15 @@ if TYPE_CHECKING:
     from robot.result import ForIteration, WhileIteration
 
 
+def _has_body(item) -> bool:
+    # Items with a lazily created body have `has_body`. Using it avoids creating
+    # empty bodies. Other items are visited if they have `body`.
+    has_body = getattr(item, 'has_body', None)
+    if has_body is None:
+        return hasattr(item, 'body')
+    return has_body
+
+
 class SuiteVisitor:
     """Abstract class to ease traversing through the suite structure.
 
@@ -178,7 +187,7 @@ class SuiteVisitor:
         the body of the keyword
         """
         if self.start_keyword(keyword) is not False:
-            if hasattr(keyword, 'body'):
+            if _has_body(keyword):
                 keyword.body.visit(self)
             if getattr(keyword, 'has_teardown', False):
                 keyword.teardown.visit(self)
@@ -237,7 +246,8 @@ class SuiteVisitor:
         body.
         """
         if self.start_for_iteration(iteration) is not False:
-            iteration.body.visit(self)
+            if _has_body(iteration):
+                iteration.body.visit(self)
             self.end_for_iteration(iteration)
 
     def start_for_iteration(self, iteration: 'ForIteration'):
@@ -397,7 +407,8 @@ class SuiteVisitor:
         body.
         """
         if self.start_while_iteration(iteration) is not False:
-            iteration.body.visit(self)
+            if _has_body(iteration):
+                iteration.body.visit(self)
             self.end_while_iteration(iteration)
 
     def start_while_iteration(self, iteration: 'WhileIteration'):
@@ -419,7 +430,7 @@ class SuiteVisitor:
     def visit_return(self, return_: 'Return'):
         """Visits a RETURN elements."""
         if self.start_return(return_) is not False:
-            if hasattr(return_, 'body'):
+            if _has_body(return_):
                 return_.body.visit(self)
             self.end_return(return_)
 
@@ -442,7 +453,7 @@ class SuiteVisitor:
     def visit_continue(self, continue_: 'Continue'):
         """Visits CONTINUE elements."""
         if self.start_continue(continue_) is not False:
-            if hasattr(continue_, 'body'):
+            if _has_body(continue_):
                 continue_.body.visit(self)
             self.end_continue(continue_)
 
@@ -465,7 +476,7 @@ class SuiteVisitor:
     def visit_break(self, break_: 'Break'):
         """Visits BREAK elements."""
         if self.start_break(break_) is not False:
-            if hasattr(break_, 'body'):
+            if _has_body(break_):
                 break_.body.visit(self)
             self.end_break(break_)
 
@@ -492,7 +503,7 @@ class SuiteVisitor:
         invalid setting like ``[Invalid]``.
         """
         if self.start_error(error) is not False:
-            if hasattr(error, 'body'):
+            if _has_body(error):
                 error.body.visit(self)
             self.end_error(error)
 
@@ -89,7 +89,11 @@ class SuiteBuilder(_Builder):
     def build(self, suite):
         with self._context.prune_input(suite.tests, suite.suites):
             stats = self._get_statistics(suite)  # Must be done before pruning
-            kws = [kw for kw in (suite.setup, suite.teardown) if kw]
+            kws = []
+            if suite.has_setup:
+                kws.append(suite.setup)
+            if suite.has_teardown:
+                kws.append(suite.teardown)
             return (self._string(suite.name, attr=True),
                     self._string(suite.source),
                     self._context.relative_source(suite.source),
@@ -129,10 +133,10 @@ class TestBuilder(_Builder):
 
     def _get_keywords(self, test):
         kws = []
-        if test.setup:
+        if test.has_setup:
             kws.append(test.setup)
         kws.extend(test.body.flatten())
-        if test.teardown:
+        if test.has_teardown:
             kws.append(test.teardown)
         return kws
 
@@ -151,10 +155,12 @@ class KeywordBuilder(_Builder):
 
     def build_keyword(self, kw, split=False):
         self._context.check_expansion(kw)
-        items = kw.body.flatten()
+        # Using `has_body` avoids creating empty bodies.
+        body = kw.body if getattr(kw, 'has_body', True) else []
+        items = body.flatten() if body else []
         if getattr(kw, 'has_teardown', False):
             items.append(kw.teardown)
-        with self._context.prune_input(kw.body):
+        with self._context.prune_input(body):
             return (KEYWORD_TYPES[kw.type],
                     self._string(kw.kwname, attr=True),
                     self._string(kw.libname, attr=True),
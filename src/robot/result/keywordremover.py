@@ -70,9 +70,10 @@ class PassedKeywordRemover(_KeywordRemover):
 
     def start_suite(self, suite):
         if not suite.statistics.failed:
-            for keyword in suite.setup, suite.teardown:
-                if not self._warning_or_error(keyword):
-                    self._clear_content(keyword)
+            if suite.has_setup and not self._warning_or_error(suite.setup):
+                self._clear_content(suite.setup)
+            if suite.has_teardown and not self._warning_or_error(suite.teardown):
+                self._clear_content(suite.teardown)
 
     def visit_test(self, test):
         if not self._failed_or_warning_or_error(test):
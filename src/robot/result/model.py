@@ -35,9 +35,8 @@ __ http://robotframework.org/robotframework/latest/RobotFrameworkUserGuide.html#
 
 """
 
-from collections import OrderedDict
-from itertools import chain
-import warnings
+from pathlib import Path
+from typing import Mapping, Sequence
 
 from robot import model
 from robot.model import BodyItem, create_fixture, Keywords, Tags, TotalStatisticsBuilder
@@ -45,17 +44,17 @@ from robot.utils import get_elapsed_time, setter
 
 from .configurer import SuiteConfigurer
 from .messagefilter import MessageFilter
-from .modeldeprecation import deprecated, DeprecatedAttributesMixin
+from .modeldeprecation import deprecated, DeprecatedAttributesMixin, warn_once
 from .keywordremover import KeywordRemover
 from .suiteteardownfailed import SuiteTeardownFailed, SuiteTeardownFailureHandler
 
 
 class Body(model.Body):
-    __slots__ = []
+    __slots__ = ()
 
 
 class Branches(model.Branches):
-    __slots__ = []
+    __slots__ = ()
 
 
 class Iterations(model.BaseBody):
@@ -73,11 +72,11 @@ class Iterations(model.BaseBody):
 @Branches.register
 @Iterations.register
 class Message(model.Message):
-    __slots__ = []
+    __slots__ = ()
 
 
 class StatusMixin:
-    __slots__ = []
+    __slots__ = ()
     PASS = 'PASS'
     FAIL = 'FAIL'
     SKIP = 'SKIP'
@@ -85,30 +84,30 @@ class StatusMixin:
     NOT_SET = 'NOT SET'
 
     @property
-    def elapsedtime(self):
+    def elapsedtime(self) -> int:
         """Total execution time in milliseconds."""
         return get_elapsed_time(self.starttime, self.endtime)
 
     @property
-    def passed(self):
+    def passed(self) -> bool:
         """``True`` when :attr:`status` is 'PASS', ``False`` otherwise."""
         return self.status == self.PASS
 
     @passed.setter
-    def passed(self, passed):
+    def passed(self, passed: bool):
         self.status = self.PASS if passed else self.FAIL
 
     @property
-    def failed(self):
+    def failed(self) -> bool:
         """``True`` when :attr:`status` is 'FAIL', ``False`` otherwise."""
         return self.status == self.FAIL
 
     @failed.setter
-    def failed(self, failed):
+    def failed(self, failed: bool):
         self.status = self.FAIL if failed else self.PASS
 
     @property
-    def skipped(self):
+    def skipped(self) -> bool:
         """``True`` when :attr:`status` is 'SKIP', ``False`` otherwise.
 
         Setting to ``False`` value is ambiguous and raises an exception.
@@ -116,13 +115,13 @@ class StatusMixin:
         return self.status == self.SKIP
 
     @skipped.setter
-    def skipped(self, skipped):
+    def skipped(self, skipped: bool):
         if not skipped:
-            raise ValueError("`skipped` value must be truthy, got '%s'." % skipped)
+            raise ValueError(f"`skipped` value must be truthy, got '{skipped}'.")
         self.status = self.SKIP
 
     @property
-    def not_run(self):
+    def not_run(self) -> bool:
         """``True`` when :attr:`status` is 'NOT RUN', ``False`` otherwise.
 
         Setting to ``False`` value is ambiguous and raises an exception.
@@ -130,32 +129,79 @@ class StatusMixin:
         return self.status == self.NOT_RUN
 
     @not_run.setter
-    def not_run(self, not_run):
+    def not_run(self, not_run: bool):
         if not not_run:
-            raise ValueError("`not_run` value must be truthy, got '%s'." % not_run)
+            raise ValueError(f"`not_run` value must be truthy, got '{not_run}'.")
         self.status = self.NOT_RUN
 
 
-class ForIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
+class LazyBodyMixin:
+    """Mixin for items having a :class:`~.Body` that is created lazily.
+
+    Classes using this mixin must have ``_body`` in their ``__slots__``.
+    """
+    __slots__ = ()
+
+    @property
+    def body(self) -> Body:
+        """Child keywords, messages and control structures as a :class:`~.Body` object.
+
+        Contents depend on the item type:
+
+        - Keywords: Child keywords, messages, and control structures such as
+          IF/ELSE. Library keywords typically have an empty body.
+        - FOR and WHILE iterations: Keywords and control structures executed
+          in the iteration.
+        - RETURN, CONTINUE and BREAK: Typically empty. Only contains something
+          if running the statement has failed due to a syntax error or listeners
+          have logged messages or executed keywords.
+        - ERROR: Typically contains the message that caused the error.
+
+        The body is created when this attribute is accessed the first time.
+        Use :attr:`has_body` to check does an item have a body without
+        creating one.
+        """
+        if self._body is None:
+            self._body = self.body_class(self)
+        return self._body
+
+    @body.setter
+    def body(self, body):
+        self._body = self.body_class(self, body) if body else None
+
+    @property
+    def has_body(self) -> bool:
+        """Check does an item have a body without creating a body object.
+
+        A difference between using ``if item.has_body:`` and ``if item.body:``
+        is that accessing the :attr:`body` attribute creates a :class:`~.Body`
+        object even when the item actually does not have one. Most library
+        keywords have no body, so with bigger suite structures this can have
+        a considerable effect on memory usage.
+
+        New in Robot Framework 6.1.
+        """
+        return bool(self._body)
+
+
+class ForIteration(BodyItem, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
     """Represents one FOR loop iteration."""
     type = BodyItem.ITERATION
     body_class = Body
     repr_args = ('variables',)
-    __slots__ = ['variables', 'status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['variables', 'status', 'starttime', 'endtime', 'doc', '_body']
 
-    def __init__(self, variables=None, status='FAIL', starttime=None, endtime=None,
-                 doc='', parent=None):
-        self.variables = variables or OrderedDict()
+    def __init__(self, variables: 'Mapping[str, str]|None' = None,
+                 status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
+        self.variables = variables if variables is not None else {}
         self.parent = parent
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
         self.doc = doc
-        self.body = None
-
-    @setter
-    def body(self, body):
-        return self.body_class(self, body)
+        self._body = None
 
     def visit(self, visitor):
         visitor.visit_for_iteration(self)
@@ -163,7 +209,8 @@ class ForIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
     @property
     @deprecated
     def name(self):
-        return ', '.join('%s = %s' % item for item in self.variables.items())
+        return ', '.join([f'{name} = {value}'
+                          for name, value in self.variables.items()])
 
 
 @Body.register
@@ -172,9 +219,12 @@ class For(model.For, StatusMixin, DeprecatedAttributesMixin):
     iteration_class = ForIteration
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, variables=(),  flavor='IN', values=(), start=None, mode=None,
-                 fill=None, status='FAIL', starttime=None, endtime=None, doc='',
-                 parent=None):
+    def __init__(self, variables: Sequence[str] = (), flavor: str = 'IN',
+                 values: Sequence[str] = (), start: 'str|None' = None,
+                 mode: 'str|None' = None, fill: 'str|None' = None,
+                 status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         super().__init__(variables, flavor, values, start, mode, fill, parent)
         self.status = status
         self.starttime = starttime
@@ -198,24 +248,21 @@ class For(model.For, StatusMixin, DeprecatedAttributesMixin):
         return f'{variables} {self.flavor} [ {values} ]'
 
 
-class WhileIteration(BodyItem, StatusMixin, DeprecatedAttributesMixin):
+class WhileIteration(BodyItem, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
     """Represents one WHILE loop iteration."""
     type = BodyItem.ITERATION
     body_class = Body
-    __slots__ = ['status', 'starttime', 'endtime', 'doc']
+    __slots__ = ['status', 'starttime', 'endtime', 'doc', '_body']
 
-    def __init__(self, status='FAIL', starttime=None, endtime=None,
-                 doc='', parent=None):
+    def __init__(self, status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         self.parent = parent
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
         self.doc = doc
-        self.body = None
-
-    @setter
-    def body(self, body):
-        return self.body_class(self, body)
+        self._body = None
 
     def visit(self, visitor):
         visitor.visit_while_iteration(self)
@@ -232,9 +279,11 @@ class While(model.While, StatusMixin, DeprecatedAttributesMixin):
     iteration_class = WhileIteration
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, condition=None, limit=None, on_limit_message=None,
-                 parent=None, status='FAIL', starttime=None,
-                 endtime=None, doc=''):
+    def __init__(self, condition: 'str|None' = None, limit: 'str|None' = None,
+                 on_limit_message: 'str|None' = None,
+                 parent: 'BodyItem|None' = None, status: str = 'FAIL',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 doc: str = ''):
         super().__init__(condition, limit, on_limit_message, parent)
         self.status = status
         self.starttime = starttime
@@ -262,8 +311,10 @@ class IfBranch(model.IfBranch, StatusMixin, DeprecatedAttributesMixin):
     body_class = Body
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, type=BodyItem.IF, condition=None, status='FAIL',
-                 starttime=None, endtime=None, doc='', parent=None):
+    def __init__(self, type: str = BodyItem.IF, condition: 'str|None' = None,
+                 status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         super().__init__(type, condition, parent)
         self.status = status
         self.starttime = starttime
@@ -282,7 +333,9 @@ class If(model.If, StatusMixin, DeprecatedAttributesMixin):
     branches_class = Branches
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, status='FAIL', starttime=None, endtime=None, doc='', parent=None):
+    def __init__(self, status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         super().__init__(parent)
         self.status = status
         self.starttime = starttime
@@ -294,8 +347,11 @@ class TryBranch(model.TryBranch, StatusMixin, DeprecatedAttributesMixin):
     body_class = Body
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, type=BodyItem.TRY, patterns=(), pattern_type=None, variable=None,
-                 status='FAIL', starttime=None, endtime=None, doc='', parent=None):
+    def __init__(self, type: str = BodyItem.TRY, patterns: Sequence[str] = (),
+                 pattern_type: 'str|None' = None, variable: 'str|None' = None,
+                 status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         super().__init__(type, patterns, pattern_type, variable, parent)
         self.status = status
         self.starttime = starttime
@@ -322,7 +378,9 @@ class Try(model.Try, StatusMixin, DeprecatedAttributesMixin):
     branches_class = Branches
     __slots__ = ['status', 'starttime', 'endtime', 'doc']
 
-    def __init__(self, status='FAIL', starttime=None, endtime=None, doc='', parent=None):
+    def __init__(self, status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, doc: str = '',
+                 parent: 'BodyItem|None' = None):
         super().__init__(parent)
         self.status = status
         self.starttime = starttime
@@ -331,26 +389,18 @@ class Try(model.Try, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Return(model.Return, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Return(model.Return, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
+    __slots__ = ['status', 'starttime', 'endtime', '_body']
     body_class = Body
 
-    def __init__(self, values=(), status='FAIL', starttime=None, endtime=None, parent=None):
+    def __init__(self, values: Sequence[str] = (), status: str = 'FAIL',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 parent: 'BodyItem|None' = None):
         super().__init__(values, parent)
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
-        self.body = None
-
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running RETURN has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
+        self._body = None
 
     @property
     @deprecated
@@ -364,26 +414,17 @@ class Return(model.Return, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Continue(model.Continue, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Continue(model.Continue, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
+    __slots__ = ['status', 'starttime', 'endtime', '_body']
     body_class = Body
 
-    def __init__(self, status='FAIL', starttime=None, endtime=None, parent=None):
+    def __init__(self, status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, parent: 'BodyItem|None' = None):
         super().__init__(parent)
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
-        self.body = None
-
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running CONTINUE has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
+        self._body = None
 
     @property
     @deprecated
@@ -397,26 +438,17 @@ class Continue(model.Continue, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Break(model.Break, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Break(model.Break, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
+    __slots__ = ['status', 'starttime', 'endtime', '_body']
     body_class = Body
 
-    def __init__(self, status='FAIL', starttime=None, endtime=None, parent=None):
+    def __init__(self, status: str = 'FAIL', starttime: 'str|None' = None,
+                 endtime: 'str|None' = None, parent: 'BodyItem|None' = None):
         super().__init__(parent)
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
-        self.body = None
-
-    @setter
-    def body(self, body):
-        """Child keywords and messages as a :class:`~.Body` object.
-
-        Typically empty. Only contains something if running BREAK has failed
-        due to a syntax error or listeners have logged messages or executed
-        keywords.
-        """
-        return self.body_class(self, body)
+        self._body = None
 
     @property
     @deprecated
@@ -430,24 +462,18 @@ class Break(model.Break, StatusMixin, DeprecatedAttributesMixin):
 
 
 @Body.register
-class Error(model.Error, StatusMixin, DeprecatedAttributesMixin):
-    __slots__ = ['status', 'starttime', 'endtime']
+class Error(model.Error, StatusMixin, LazyBodyMixin, DeprecatedAttributesMixin):
+    __slots__ = ['status', 'starttime', 'endtime', '_body']
     body_class = Body
 
-    def __init__(self, values=(), status='FAIL', starttime=None, endtime=None, parent=None):
+    def __init__(self, values: Sequence[str] = (), status: str = 'FAIL',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 parent: 'BodyItem|None' = None):
         super().__init__(values, parent)
         self.status = status
         self.starttime = starttime
         self.endtime = endtime
-        self.body = None
-
-    @setter
-    def body(self, body):
-        """Messages as a :class:`~.Body` object.
-
-        Typically contains the message that caused the error.
-        """
-        return self.body_class(self, body)
+        self._body = None
 
     @property
     @deprecated
@@ -468,15 +494,19 @@ class Error(model.Error, StatusMixin, DeprecatedAttributesMixin):
 @Body.register
 @Branches.register
 @Iterations.register
-class Keyword(model.Keyword, StatusMixin):
+class Keyword(model.Keyword, StatusMixin, LazyBodyMixin):
     """Represents an executed library or user keyword."""
     body_class = Body
     __slots__ = ['kwname', 'libname', 'doc', 'timeout', 'status', '_teardown',
-                 'starttime', 'endtime', 'message', 'sourcename']
-
-    def __init__(self, kwname='', libname='', doc='', args=(), assign=(), tags=(),
-                 timeout=None, type=BodyItem.KEYWORD, status='FAIL', starttime=None,
-                 endtime=None, parent=None, sourcename=None):
+                 'starttime', 'endtime', 'message', 'sourcename', '_body']
+
+    def __init__(self, kwname: 'str|None' = '', libname: 'str|None' = '',
+                 doc: str = '', args: Sequence[str] = (), assign: Sequence[str] = (),
+                 tags: Sequence[str] = (), timeout: 'str|None' = None,
+                 type: str = BodyItem.KEYWORD, status: str = 'FAIL',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 parent: 'TestSuite|TestCase|BodyItem|None' = None,
+                 sourcename: 'str|None' = None):
         super().__init__(None, args, assign, type, parent)
         #: Name of the keyword without library or resource name.
         self.kwname = kwname
@@ -493,16 +523,7 @@ class Keyword(model.Keyword, StatusMixin):
         #: Original name of keyword with embedded arguments.
         self.sourcename = sourcename
         self._teardown = None
-        self.body = None
-
-    @setter
-    def body(self, body):
-        """Possible keyword body as a :class:`~.Body` object.
-
-        Body can consist of child keywords, messages, and control structures
-        such as IF/ELSE. Library keywords typically have an empty body.
-        """
-        return self.body_class(self, body)
+        self._body = None
 
     @property
     def keywords(self):
@@ -510,8 +531,8 @@ class Keyword(model.Keyword, StatusMixin):
 
         Use :attr:`body` or :attr:`teardown` instead.
         """
-        keywords = self.body.filter(messages=False)
-        if self.teardown:
+        keywords = self._filter_body(messages=False)
+        if self.has_teardown:
             keywords.append(self.teardown)
         return Keywords(self, keywords)
 
@@ -526,7 +547,15 @@ class Keyword(model.Keyword, StatusMixin):
         Starting from Robot Framework 4.0 this is a list generated from messages
         in :attr:`body`.
         """
-        return self.body.filter(messages=True)
+        return self._filter_body(messages=True)
+
+    def _filter_body(self, messages):
+        # Faster than `body.filter()` and does not create empty body objects.
+        if not self.has_body:
+            return []
+        message_class = self.body.message_class
+        return [item for item in self.body
+                if isinstance(item, message_class) is messages]
 
     @property
     def children(self):
@@ -534,7 +563,7 @@ class Keyword(model.Keyword, StatusMixin):
 
         Deprecated since Robot Framework 4.0. Use :attr:`body` instead.
         """
-        warnings.warn("'Keyword.children' is deprecated. Use 'Keyword.body' instead.")
+        warn_once("'Keyword.children' is deprecated. Use 'Keyword.body' instead.")
         return list(self.body)
 
     @property
@@ -550,7 +579,7 @@ class Keyword(model.Keyword, StatusMixin):
         """
         if not self.libname:
             return self.kwname
-        return '%s.%s' % (self.libname, self.kwname)
+        return f'{self.libname}.{self.kwname}'
 
     @name.setter
     def name(self, name):
@@ -626,9 +655,11 @@ class TestCase(model.TestCase, StatusMixin):
     body_class = Body
     fixture_class = Keyword
 
-    def __init__(self, name='', doc='', tags=None, timeout=None, lineno=None,
-                 status='FAIL', message='', starttime=None, endtime=None,
-                 parent=None):
+    def __init__(self, name: str = '', doc: str = '', tags: Sequence[str] = (),
+                 timeout: 'str|None' = None, lineno: 'int|None' = None,
+                 status: str = 'FAIL', message: str = '',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 parent: 'TestSuite|None' = None):
         super().__init__(name, doc, tags, timeout, lineno, parent)
         #: Status as a string ``PASS`` or ``FAIL``. See also :attr:`passed`.
         self.status = status
@@ -646,7 +677,7 @@ class TestCase(model.TestCase, StatusMixin):
 
     @property
     def critical(self):
-        warnings.warn("'TestCase.critical' is deprecated and always returns 'True'.")
+        warn_once("'TestCase.critical' is deprecated and always returns 'True'.")
         return True
 
 
@@ -659,8 +690,11 @@ class TestSuite(model.TestSuite, StatusMixin):
     test_class = TestCase
     fixture_class = Keyword
 
-    def __init__(self, name='', doc='', metadata=None, source=None, message='',
-                 starttime=None, endtime=None, rpa=False, parent=None):
+    def __init__(self, name: str = '', doc: str = '',
+                 metadata: 'Mapping[str, str]|None' = None,
+                 source: 'Path|str|None' = None, message: str = '',
+                 starttime: 'str|None' = None, endtime: 'str|None' = None,
+                 rpa: bool = False, parent: 'TestSuite|None' = None):
         super().__init__(name, doc, metadata, source, rpa, parent)
         #: Possible suite setup or teardown error message.
         self.message = message
@@ -697,12 +731,17 @@ class TestSuite(model.TestSuite, StatusMixin):
         - If there are no failed or passed tests, status is 'SKIP'. This covers both
           the case when all tests have been skipped and when there are no tests.
         """
-        stats = self.statistics  # Local variable avoids recreating stats.
-        if stats.failed:
-            return self.FAIL
-        if stats.passed:
-            return self.PASS
-        return self.SKIP
+        # Using `statistics` would be simpler, but it always processes all tests.
+        # This loop can return immediately when a failed test is found.
+        # Comparing `test.status` directly avoids `passed/skipped` property calls.
+        passed = False
+        for test in self.all_tests:
+            status = test.status
+            if status == self.PASS:
+                passed = True
+            elif status != self.SKIP:
+                return self.FAIL
+        return self.PASS if passed else self.SKIP
 
     @property
     def statistics(self):
@@ -735,8 +774,17 @@ class TestSuite(model.TestSuite, StatusMixin):
         """Total execution time in milliseconds."""
         if self.starttime and self.endtime:
             return get_elapsed_time(self.starttime, self.endtime)
-        return sum(child.elapsedtime for child in
-                   chain(self.suites, self.tests, (self.setup, self.teardown)))
+        elapsed = 0
+        for suite in self.suites:
+            elapsed += suite.elapsedtime
+        for test in self.tests:
+            elapsed += test.elapsedtime
+        # Using `has_setup/teardown` avoids creating setup/teardown objects.
+        if self.has_setup:
+            elapsed += self.setup.elapsedtime
+        if self.has_teardown:
+            elapsed += self.teardown.elapsedtime
+        return elapsed
 
     def remove_keywords(self, how):
         """Remove keywords based on the given condition.
@@ -13,9 +13,21 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import warnings
+
 from robot.model import Tags
 
 
+_emitted_warnings = set()
+
+
+def warn_once(message):
+    """Emit deprecation warning with the given message only once per process."""
+    if message not in _emitted_warnings:
+        _emitted_warnings.add(message)
+        warnings.warn(message)
+
+
 def deprecated(method):
     def wrapper(self, *args, **kws):
         """Deprecated."""
@@ -24,7 +36,7 @@ def deprecated(method):
 
 
 class DeprecatedAttributesMixin:
-    __slots__ = []
+    __slots__ = ()
 
     @property
     @deprecated
@@ -19,11 +19,13 @@ from robot.model import SuiteVisitor
 class SuiteTeardownFailureHandler(SuiteVisitor):
 
     def end_suite(self, suite):
+        if not suite.has_teardown:
+            return
         teardown = suite.teardown
         # Both 'PASS' and 'NOT RUN' statuses are OK.
-        if teardown and teardown.status == teardown.FAIL:
+        if teardown.status == teardown.FAIL:
             suite.suite_teardown_failed(teardown.message)
-        if teardown and teardown.status == teardown.SKIP:
+        if teardown.status == teardown.SKIP:
             suite.suite_teardown_skipped(teardown.message)
 
     def visit_test(self, test):
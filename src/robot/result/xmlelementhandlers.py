@@ -13,8 +13,12 @@
 #  See the License for the specific language governing permissions and
 #  limitations under the License.
 
+import sys
+
 from robot.errors import DataError
 
+from .model import StatusMixin
+
 
 class XmlElementHandler:
 
@@ -137,10 +141,14 @@ class KeywordHandler(ElementHandler):
             body = result.body
         except AttributeError:
             body = self._get_body_for_suite_level_keyword(result)
-        return body.create_keyword(kwname=elem.get('name', ''),
-                                   libname=elem.get('library'),
+        # Keyword and library names are repeated a lot. Interning saves memory.
+        return body.create_keyword(kwname=sys.intern(elem.get('name', '')),
+                                   libname=self._intern(elem.get('library')),
                                    sourcename=elem.get('sourcename'))
 
+    def _intern(self, value):
+        return sys.intern(value) if value is not None else None
+
     def _get_body_for_suite_level_keyword(self, result):
         # Someone, most likely a listener, has created a `<kw>` element on suite level.
         # Add the keyword into a suite setup or teardown, depending on have we already
@@ -283,11 +291,16 @@ class ErrorHandler(ElementHandler):
 @ElementHandler.register
 class MessageHandler(ElementHandler):
     tag = 'msg'
+    # Levels parsed from XML are separate string objects. Using shared objects
+    # instead saves memory.
+    levels = {level: level for level in ('TRACE', 'DEBUG', 'INFO', 'WARN', 'ERROR',
+                                         'FAIL', 'SKIP')}
 
     def end(self, elem, result):
         html_true = ('true', 'yes')    # 'yes' is compatibility for RF < 4.
+        level = elem.get('level', 'INFO')
         result.body.create_message(elem.text or '',
-                                   elem.get('level', 'INFO'),
+                                   self.levels.get(level, level),
                                    elem.get('html') in html_true,
                                    self._timestamp(elem, 'timestamp'))
 
@@ -295,13 +308,19 @@ class MessageHandler(ElementHandler):
 @ElementHandler.register
 class StatusHandler(ElementHandler):
     tag = 'status'
+    # Statuses parsed from XML are separate string objects. Using the shared
+    # constants instead saves memory and makes status comparisons faster.
+    statuses = {status: status for status in (StatusMixin.PASS, StatusMixin.FAIL,
+                                              StatusMixin.SKIP, StatusMixin.NOT_RUN,
+                                              StatusMixin.NOT_SET)}
 
     def __init__(self, set_status=True):
         self.set_status = set_status
 
     def end(self, elem, result):
         if self.set_status:
-            result.status = elem.get('status', 'FAIL')
+            status = elem.get('status', 'FAIL')
+            result.status = self.statuses.get(status, status)
         result.starttime = self._timestamp(elem, 'starttime')
         result.endtime = self._timestamp(elem, 'endtime')
         if elem.text:
@@ -14,6 +14,7 @@
 #  limitations under the License.
 
 from collections.abc import MutableMapping
+from functools import partial
 import re
 
 from .robottypes import is_dict_like, is_string
@@ -60,7 +61,8 @@ class NormalizedDict(MutableMapping):
         """
         self._data = {}
         self._keys = {}
-        self._normalize = lambda s: normalize(s, ignore, caseless, spaceless)
+        self._normalize = partial(normalize, ignore=ignore, caseless=caseless,
+                                  spaceless=spaceless)
         if initial:
             items = initial.items() if hasattr(initial, 'items') else initial
             for key, value in items:
@@ -17,6 +17,7 @@ import re
 import time
 import warnings
 from datetime import timedelta
+from functools import lru_cache
 
 from .normalizing import normalize
 from .misc import plural_or_not
@@ -398,11 +399,19 @@ def _elapsed_time_to_string_without_millis(elapsed):
 def _timestamp_to_millis(timestamp, seps=None):
     if seps:
         timestamp = _normalize_timestamp(timestamp, seps)
-    Y, M, D, h, m, s, millis = _split_timestamp(timestamp)
-    secs = time.mktime((Y, M, D, h, m, s, 0, 0, -1))
+    secs = _timestamp_to_secs(timestamp[:17])
+    millis = int(timestamp[18:21])
     return round(1000*secs + millis)
 
 
+# Converting date and time to seconds is relatively slow and timestamps that
+# are processed together often share them. Caching the result thus helps.
+@lru_cache(maxsize=256)
+def _timestamp_to_secs(timestamp):
+    Y, M, D, h, m, s = _split_timestamp(timestamp)
+    return time.mktime((Y, M, D, h, m, s, 0, 0, -1))
+
+
 def _normalize_timestamp(ts, seps):
     for sep in seps:
         if sep in ts:
@@ -418,8 +427,7 @@ def _split_timestamp(timestamp):
     hours = int(timestamp[9:11])
     mins = int(timestamp[12:14])
     secs = int(timestamp[15:17])
-    millis = int(timestamp[18:21])
-    return years, mons, days, hours, mins, secs, millis
+    return years, mons, days, hours, mins, secs
 
 
 class TimestampCache:
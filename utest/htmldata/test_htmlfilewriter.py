@@ -0,0 +1,40 @@
+import unittest
+from io import StringIO
+
+from robot.htmldata import HtmlFileWriter, ModelWriter, LIBDOC
+from robot.utils.asserts import assert_equal, assert_true
+
+
+class MyModelWriter(ModelWriter):
+
+    def __init__(self, output):
+        self.output = output
+        self.lines = []
+
+    def write(self, line):
+        self.lines.append(line)
+        self.output.write('<script>MODEL</script>\n')
+
+
+class TestHtmlFileWriter(unittest.TestCase):
+
+    def test_write(self):
+        output = StringIO()
+        model_writer = MyModelWriter(output)
+        HtmlFileWriter(output, model_writer).write(LIBDOC)
+        html = output.getvalue()
+        assert_true(html.startswith('<!DOCTYPE html>\n'))
+        assert_true(html.endswith('</html>\n'))
+        assert_equal(html.count('<script>MODEL</script>'), 1)
+        assert_equal(len(model_writer.lines), 1)
+        assert_true(model_writer.lines[0].startswith('<!-- JS MODEL -->'))
+
+    def test_written_content_is_same_when_writing_again(self):
+        outputs = [StringIO(), StringIO()]
+        for output in outputs:
+            HtmlFileWriter(output, MyModelWriter(output)).write(LIBDOC)
+        assert_equal(outputs[0].getvalue(), outputs[1].getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
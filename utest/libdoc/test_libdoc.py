@@ -2,6 +2,7 @@ import json
 import os
 import tempfile
 import unittest
+from io import StringIO
 from pathlib import Path
 
 from jsonschema import validate
@@ -243,6 +244,27 @@ class TestJson(unittest.TestCase):
         self.assertDictEqual(data, orig_data)
 
 
+class TestSaveToOpenFile(unittest.TestCase):
+
+    def test_xml(self):
+        output = StringIO()
+        LibraryDocumentation(DATADIR / 'DynamicLibrary.json').save(output, 'XML')
+        assert_equal(output.closed, False)
+        assert '<keywordspec name="DynamicLibrary"' in output.getvalue()
+
+    def test_json(self):
+        output = StringIO()
+        LibraryDocumentation(DATADIR / 'DynamicLibrary.json').save(output, 'json')
+        assert_equal(output.closed, False)
+        assert_equal(json.loads(output.getvalue())['name'], 'DynamicLibrary')
+
+    def test_json_is_same_as_to_json(self):
+        libdoc = LibraryDocumentation(DATADIR / 'DynamicLibrary.json')
+        output = StringIO()
+        libdoc.save(output, 'JSON')
+        assert_equal(output.getvalue(), libdoc.to_json(indent=2))
+
+
 class TestXmlSpec(unittest.TestCase):
 
     def test_roundtrip(self):
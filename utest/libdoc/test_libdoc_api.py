@@ -1,4 +1,6 @@
 from io import StringIO
+from pathlib import Path
+import os
 import sys
 import tempfile
 import unittest
@@ -43,6 +45,56 @@ class TestLibdoc(unittest.TestCase):
         with open(output) as f:
             assert '"name": "String"' in f.read()
 
+    def test_cache(self):
+        output = tempfile.mkstemp(suffix='.xml')[1]
+        os.environ['ROBOT_LIBDOC_CACHE'] = 'true'
+        try:
+            libdoc._build_cached_libdoc.cache_clear()
+            libdoc.libdoc('String', output, quiet=True)
+            libdoc.libdoc('String', output, quiet=True)
+            libdoc.libdoc('String', output, name='Custom', quiet=True)
+            info = libdoc._build_cached_libdoc.cache_info()
+            assert_equal((info.hits, info.misses), (1, 2))
+            path = Path(libdoc.__file__).parent / 'libraries' / 'String.py'
+            for _ in range(2):
+                assert_equal(libdoc.libdoc(path, output, name='Custom', quiet=True), 0)
+            info = libdoc._build_cached_libdoc.cache_info()
+            assert_equal((info.hits, info.misses), (2, 3))
+        finally:
+            del os.environ['ROBOT_LIBDOC_CACHE']
+        with open(output) as f:
+            assert 'name="Custom"' in f.read()
+
+    def test_cache_with_pythonpath(self):
+        output = tempfile.mkstemp(suffix='.xml')[1]
+        path = tempfile.gettempdir()
+        orig_sys_path = sys.path[:]
+        os.environ['ROBOT_LIBDOC_CACHE'] = 'yes'
+        try:
+            libdoc._build_cached_libdoc.cache_clear()
+            for _ in range(3):
+                libdoc.libdoc_cli(['--pythonpath', path, 'String', output], exit=False)
+            info = libdoc._build_cached_libdoc.cache_info()
+            assert_equal((info.hits, info.misses), (2, 1))
+            assert_equal(sys.path.count(path), 1)
+            assert_equal(sys.path[0], path)
+        finally:
+            del os.environ['ROBOT_LIBDOC_CACHE']
+            sys.path = orig_sys_path
+
+    def test_cache_disabled_with_false_value(self):
+        output = tempfile.mkstemp(suffix='.xml')[1]
+        for value in 'false', 'No', '0', 'NONE', '':
+            os.environ['ROBOT_LIBDOC_CACHE'] = value
+            try:
+                libdoc._build_cached_libdoc.cache_clear()
+                libdoc.libdoc('String', output, quiet=True)
+                libdoc.libdoc('String', output, quiet=True)
+                info = libdoc._build_cached_libdoc.cache_info()
+                assert_equal((info.hits, info.misses), (0, 0))
+            finally:
+                del os.environ['ROBOT_LIBDOC_CACHE']
+
     def test_LibraryDocumentation(self):
         doc = libdoc.LibraryDocumentation('OperatingSystem')
         assert_equal(doc.name, 'OperatingSystem')
@@ -28,6 +28,15 @@ class TestTags(unittest.TestCase):
     def test_init_with_none(self):
         assert_equal(list(Tags(None)), [])
 
+    def test_init_with_tags(self):
+        orig = Tags(['t1', 'robot:x'])
+        tags = Tags(orig)
+        assert_equal(list(tags), ['robot:x', 't1'])
+        assert_equal(tags.robot('x'), True)
+        tags.add('t2')
+        assert_equal(list(tags), ['robot:x', 't1', 't2'])
+        assert_equal(list(orig), ['robot:x', 't1'])
+
     def test_robot(self):
         assert_equal(Tags().robot('x'), False)
         assert_equal(Tags('robot:x').robot('x'), True)
@@ -4,11 +4,11 @@ import zlib
 from pathlib import Path
 
 from robot.utils.asserts import assert_equal, assert_true
-from robot.result import Keyword, Message, TestCase, TestSuite
+from robot.result import ExecutionResult, Keyword, Message, TestCase, TestSuite
 from robot.result.executionerrors import ExecutionErrors
-from robot.model import Statistics, BodyItem
+from robot.model import BodyItem, Statistics, SuiteVisitor
 from robot.reporting.jsmodelbuilders import (
-    ErrorsBuilder, JsBuildingContext, KeywordBuilder, MessageBuilder,
+    ErrorsBuilder, JsBuildingContext, JsModelBuilder, KeywordBuilder, MessageBuilder,
     StatisticsBuilder, SuiteBuilder, TestBuilder
 )
 from robot.reporting.stringcache import StringIndex
@@ -150,6 +150,21 @@ class TestBuildTestSuite(unittest.TestCase):
                            tests=(T1, T2), stats=(3, 1, 2, 0))
         self._verify_min_message_level('TRACE')
 
+    def test_keyword_bodies_are_not_created(self):
+        result = ExecutionResult(CURDIR.parent / 'result' / 'golden.xml')
+        keywords = []
+
+        class KeywordCollector(SuiteVisitor):
+            def start_keyword(self, keyword):
+                keywords.append(keyword)
+
+        result.suite.visit(KeywordCollector())
+        # Accessing `body` creates an empty body that `has_body` does not detect.
+        bodies = [kw._body is not None for kw in keywords]
+        assert_true(not all(bodies))
+        JsModelBuilder().build_from(result)
+        assert_equal([kw._body is not None for kw in keywords], bodies)
+
     def test_timestamps(self):
         suite = TestSuite(starttime='20111205 00:33:33.333')
         suite.setup.config(kwname='s1', starttime='20111205 00:33:33.334')
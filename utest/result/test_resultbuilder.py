@@ -1,4 +1,5 @@
 import os
+import sys
 import unittest
 import tempfile
 from io import StringIO
@@ -6,6 +7,7 @@ from pathlib import Path
 
 from robot.errors import DataError
 from robot.result import ExecutionResult, ExecutionResultBuilder, Result, TestSuite
+from robot.result.xmlelementhandlers import MessageHandler
 from robot.utils.asserts import assert_equal, assert_false, assert_true, assert_raises
 
 
@@ -56,6 +58,21 @@ class TestBuildingSuiteExecutionResult(unittest.TestCase):
         assert_equal(len(keyword.body), 1)
         assert_equal(keyword.body[0].type, keyword.body[0].MESSAGE)
 
+    def test_statuses_are_shared_constants(self):
+        keyword = self.test.body[0]
+        assert_true(self.test.status is self.test.PASS)
+        assert_true(keyword.status is keyword.PASS)
+
+    def test_message_levels_are_shared(self):
+        message = self.test.body[0].body[0]
+        assert_equal(message.level, 'INFO')
+        assert_true(message.level is MessageHandler.levels['INFO'])
+
+    def test_keyword_and_library_names_are_interned(self):
+        keyword, user_keyword = self.test.body[0], self.test.body[1]
+        for name in keyword.kwname, keyword.libname, user_keyword.kwname:
+            assert_true(name is sys.intern(name))
+
     def test_user_keyword_is_built(self):
         user_keyword = self.test.body[1]
         assert_equal(user_keyword.name, 'logs on trace')
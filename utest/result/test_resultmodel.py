@@ -1,7 +1,9 @@
+import pickle
 import unittest
 import warnings
 
 from robot.model import Tags
+from robot.result import modeldeprecation
 from robot.result import (Break, Continue, Error, For, If, IfBranch, Keyword, Message,
                           Return, TestCase, TestSuite, Try, While)
 from robot.utils.asserts import (assert_equal, assert_false, assert_raises,
@@ -91,6 +93,14 @@ class TestSuiteStatus(unittest.TestCase):
         suite.tests.create(status='PASS')
         assert_equal(suite.status, 'FAIL')
 
+    def test_suite_status_is_fail_if_test_status_is_not_pass_or_skip(self):
+        for status in 'NOT RUN', 'NOT SET', 'INVALID':
+            suite = TestSuite()
+            suite.tests.create(status='PASS')
+            suite.suites.create().tests.create(status=status)
+            assert_equal(suite.status, 'FAIL')
+            assert_equal(suite.statistics.failed, 1)
+
     def test_status_propertys(self):
         suite = TestSuite()
         assert_false(suite.passed)
@@ -138,6 +148,41 @@ class TestElapsedTime(unittest.TestCase):
                            endtime='19991212 13:00:01.010')
         assert_equal(suite.elapsedtime, 3610000)
 
+    def test_suite_elapsed_time_is_sum_of_children(self):
+        suite = TestSuite()
+        suite.tests.create(starttime='19991212 12:00:00.010',
+                           endtime='19991212 12:00:01.010')
+        suite.suites.create().tests.create(starttime='19991212 12:00:00.000',
+                                           endtime='19991212 12:00:00.500')
+        assert_equal(suite.elapsedtime, 1500)
+        assert_equal(suite.has_setup, False)
+        assert_equal(suite.has_teardown, False)
+
+
+class TestPickle(unittest.TestCase):
+
+    def test_pickle_suite(self):
+        suite = TestSuite(name='Suite', metadata={'Name': 'Value'})
+        suite.setup.config(kwname='Setup', status='PASS')
+        test = suite.tests.create(name='Test', tags=['t1'], status='FAIL')
+        kw = test.body.create_keyword(kwname='KW', libname='Lib', status='FAIL')
+        kw.body.create_message('Hello!', level='WARN')
+        kw.teardown.config(kwname='Teardown')
+        copy = pickle.loads(pickle.dumps(suite))
+        assert_equal(copy.name, 'Suite')
+        assert_equal(copy.metadata['name'], 'Value')
+        assert_equal(copy.setup.name, 'Setup')
+        assert_equal(copy.status, 'FAIL')
+        assert_equal(copy.tests[0].tags, ['t1'])
+        assert_equal(copy.tests[0].parent, copy)
+        copy_kw = copy.tests[0].body[0]
+        assert_equal(copy_kw.name, 'Lib.KW')
+        assert_equal(copy_kw.parent, copy.tests[0])
+        assert_equal(copy_kw.messages[0].message, 'Hello!')
+        assert_equal(copy_kw.messages[0].parent, copy_kw)
+        assert_equal(copy_kw.teardown.name, 'Teardown')
+        assert_equal(copy.to_dict(), suite.to_dict())
+
 
 class TestSlots(unittest.TestCase):
 
@@ -252,6 +297,8 @@ class TestModel(unittest.TestCase):
         assert_equal(item.not_run, False)
         assert_equal(item.status, 'SKIP')
         assert_raises(ValueError, setattr, item, 'skipped', False)
+        assert_raises_with_msg(ValueError, "`skipped` value must be truthy, got '()'.",
+                               setattr, item, 'skipped', ())
         if isinstance(item, TestCase):
             assert_raises(AttributeError, setattr, item, 'not_run', True)
             assert_raises(AttributeError, setattr, item, 'not_run', False)
@@ -263,6 +310,8 @@ class TestModel(unittest.TestCase):
             assert_equal(item.not_run, True)
             assert_equal(item.status, 'NOT RUN')
             assert_raises(ValueError, setattr, item, 'not_run', False)
+            assert_raises_with_msg(ValueError, "`not_run` value must be truthy, got '()'.",
+                                   setattr, item, 'not_run', ())
 
     def test_keyword_teardown(self):
         kw = Keyword()
@@ -283,6 +332,21 @@ class TestModel(unittest.TestCase):
         assert_equal(kw.teardown.name, None)
         assert_equal(kw.teardown.type, 'TEARDOWN')
 
+    def test_body_is_created_lazily(self):
+        for item in (Keyword(), Return(), Continue(), Break(), Error(),
+                     For().body.create_iteration(), While().body.create_iteration()):
+            assert_true(not item.has_body)
+            assert_equal(list(item.body), [])
+            assert_true(not item.has_body)
+            item.body.create_message('Hello!')
+            assert_true(item.has_body)
+            assert_equal(item.body[0].parent, item)
+            item.body = None
+            assert_true(not item.has_body)
+            item.body = [Message('Hi!')]
+            assert_true(item.has_body)
+            assert_equal(item.body[0].parent, item)
+
     def test_keywords_deprecation(self):
         kw = Keyword()
         kw.body = [Keyword(), Message(), Keyword(), Keyword(), Message()]
@@ -294,6 +358,20 @@ class TestModel(unittest.TestCase):
         assert_raises(AttributeError, kws.append, Keyword())
         assert_raises(AttributeError, setattr, kw, 'keywords', [])
 
+    def test_deprecation_warnings_are_emitted_once(self):
+        kw = Keyword()
+        kw.body.create_keyword('k')
+        test = TestCase()
+        modeldeprecation._emitted_warnings.clear()
+        with warnings.catch_warnings(record=True) as w:
+            warnings.simplefilter('always')
+            for _ in range(3):
+                assert_equal(kw.children, list(kw.body))
+                assert_equal(test.critical, True)
+        assert_equal([str(warning.message) for warning in w],
+                     ["'Keyword.children' is deprecated. Use 'Keyword.body' instead.",
+                      "'TestCase.critical' is deprecated and always returns 'True'."])
+
     def test_for_parents(self):
         test = TestCase()
         for_ = test.body.create_for()
@@ -307,6 +385,15 @@ class TestModel(unittest.TestCase):
         kw = iter2.body.create_keyword()
         assert_equal(kw.parent, iter2)
 
+    def test_for_iteration_variables(self):
+        iteration = For().body.create_iteration()
+        assert_equal(iteration.variables, {})
+        iteration.variables['${x}'] = '1'
+        iteration.variables['${y}'] = '2'
+        assert_equal(list(iteration.variables), ['${x}', '${y}'])
+        variables = {'${z}': '3'}
+        assert_true(For().body.create_iteration(variables).variables is variables)
+
     def test_if_parents(self):
         test = TestCase()
         if_ = test.body.create_if()
@@ -358,6 +445,16 @@ class TestBody(unittest.TestCase):
         k3 = kw.body.create_keyword('k3')
         assert_equal(list(kw.body), [m1, k1, k2, m2, k3])
 
+    def test_messages(self):
+        kw = Keyword()
+        assert_equal(kw.messages, [])
+        assert_true(not kw.has_body)
+        m1 = kw.body.create_message('m1')
+        kw.body.create_keyword('k1')
+        kw.body.create_if()
+        m2 = kw.body.create_message('m2')
+        assert_equal(kw.messages, [m1, m2])
+
     def test_order_after_modifications(self):
         kw = Keyword('parent')
         kw.body.create_keyword('k1')
@@ -3,7 +3,7 @@ from os.path import dirname, join
 
 from robot.api.parsing import get_model
 from robot.result import ExecutionResult
-from robot.model import SuiteVisitor, TestSuite
+from robot.model import Body, Keyword, SuiteVisitor, TestSuite
 from robot.result import TestSuite as ResultSuite
 from robot.running import TestSuite as RunningSuite
 from robot.utils.asserts import assert_equal
@@ -236,6 +236,23 @@ END IF/ELSE ROOT
             assert_equal(getattr(visitor, f'visited_{visited}'), True, visited)
             assert_equal(getattr(visitor, f'visited_{visited}_body'), True, f'{visited}_body')
 
+    def test_visit_body_of_item_without_has_body(self):
+        class KeywordWithBody(Keyword):
+            __slots__ = ['body']
+
+        parent = KeywordWithBody('Parent')
+        parent.body = Body(parent, [Keyword('Child')])
+        test = TestSuite().tests.create()
+        test.body.append(parent)
+        visited = []
+
+        class Visitor(SuiteVisitor):
+            def start_keyword(self, keyword):
+                visited.append(keyword.name)
+
+        test.visit(Visitor())
+        assert_equal(visited, ['Parent', 'Child'])
+
 
 class StartSuiteStopping(SuiteVisitor):
 
@@ -1,3 +1,4 @@
+import pickle
 import unittest
 from collections import UserDict
 
@@ -169,6 +170,13 @@ class TestNormalizedDict(unittest.TestCase):
         assert_false(NormalizedDict())
         assert_true(NormalizedDict({'a': 1}))
 
+    def test_pickle(self):
+        nd = NormalizedDict({'a': 1, 'B': 2}, ignore=['_'])
+        copy = pickle.loads(pickle.dumps(nd))
+        assert_equal(copy, nd)
+        assert_equal(copy['A_'], 1)
+        assert_equal(list(copy), ['a', 'B'])
+
     def test_copy(self):
         nd = NormalizedDict({'a': 1, 'B': 1})
         cd = nd.copy()